@@ -3,9 +3,10 @@
 
 
 import enum
+import functools
 
 
-class MODIFIER_KEY(enum.Enum):
+class MODIFIER_KEY(str, enum.Enum):
     """Represents modifier keys such as 'ctrl', 'shift' and so on.
     Not every combination of modifier and input is useful."""
 
@@ -19,8 +20,16 @@ class MODIFIER_KEY(enum.Enum):
     SHIFT_ALT_CTRL = "shift meta ctrl"
     
     def append_to(self, text, separator=" "):
-        return (text + separator + self.value) if (self != self.__class__.NONE) else text
+        return text if (self is MODIFIER_KEY.NONE) else f"{text}{separator}{self.value}"
+    
+    # The prefix for the common separator is computed only once per member.
+    @functools.cached_property
+    def _prefix(self):
+        return "" if (self is MODIFIER_KEY.NONE) else f"{self.value} "
     
     def prepend_to(self, text, separator=" "):
-        return (self.value + separator + text) if (self != self.__class__.NONE) else text
+        if separator == " ":
+            return self._prefix + text
+        
+        return text if (self is MODIFIER_KEY.NONE) else f"{self.value}{separator}{text}"
     
\ No newline at end of file
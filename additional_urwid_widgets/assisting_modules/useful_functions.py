@@ -4,6 +4,10 @@
 """A non-thematic collection of useful functions."""
 
 
+# Holds the attribute maps handed out by 'shared_attr_map()'.
+_ATTR_MAP_POOL = {}
+
+
 def recursively_replace(original, replacements, include_original_keys=False):
     """Clones an iterable and recursively replaces specific values."""
     
@@ -45,3 +49,14 @@ def recursively_replace(original, replacements, include_original_keys=False):
         return obj
 
     return _recursion_helper(original)
+
+
+def shared_attr_map(value):
+    """Returns a single-key attribute map ('{None: value}') which is shared by all callers passing the same value.
+    This is safe, because 'urwid.AttrMap.set_attr_map()' copies the passed dict."""
+    
+    try:
+        return _ATTR_MAP_POOL.setdefault(value, {None:value})
+    except TypeError:
+        # An unhashable value can not be pooled. (It is rejected by 'urwid.AttrMap' anyway.)
+        return {None:value}
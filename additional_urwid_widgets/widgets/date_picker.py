@@ -14,11 +14,63 @@ import enum
 import urwid
 
 
+# The number of days of each month in a common year.
+_MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Offsets used by '_weekday()', one per month.
+_WEEKDAY_OFFSETS = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
+
+
+def _month_length(year, month):
+    if (month == 2) and (year % 4 == 0) and ((year % 100 != 0) or (year % 400 == 0)):
+        return 29
+    
+    return _MONTH_LENGTHS[month - 1]
+
+
+def _pack_date(year, month, day):
+    # Packs a date into a single integer which preserves the order of dates. (The month needs 4 bits and the day 5 bits.)
+    return (year << 9) | (month << 5) | day
+
+
+def _weekday(year, month, day):
+    # Sakamoto's method. Like 'calendar.weekday()', it returns 0 for Monday. (The formula itself starts the week on Sunday.)
+    if month < 3:
+        year -= 1
+    
+    return (year + year // 4 - year // 100 + year // 400 + _WEEKDAY_OFFSETS[month - 1] + day + 6) % 7
+
+
+# The following functions create a column of the day picker for the days 'start' to 'end' (included) of a month.
+# (See 'DatePicker._DAY_COLUMN_BUILDERS'.)
+def _day_of_month_column(picker, year, month, start, end):
+    return picker._DAY_STRINGS[start:end+1]
+
+
+def _two_digit_day_of_month_column(picker, year, month, start, end):
+    return picker._TWO_DIGIT_DAY_STRINGS[start:end+1]
+
+
+def _weekday_column(picker, year, month, start, end):
+    # The weekday of the first listed day.
+    weekday = _weekday(year, month, start)
+    day_names = picker._day_names
+    
+    return [day_names[(weekday + i) % 7] for i in range(end - start + 1)]
+
+
 class DatePicker(urwid.WidgetWrap):
     """Serves as a selector for dates."""
     
     _TYPE_ERR_MSG = "type {} was expected for {}, but found: {}."
     _VALUE_ERR_MSG = "unrecognized value: {}."
+    
+    # The displayed days of month, indexed by the day. These are needed whenever the month changes, so they are created only once.
+    _DAY_STRINGS = tuple(str(day) for day in range(32))
+    _TWO_DIGIT_DAY_STRINGS = tuple(str(day).zfill(2) for day in range(32))
+    
+    # The number of months, whose day picker items are kept. (See '_get_days()'.)
+    _MAX_CACHED_DAY_LISTS = 24
 
     # These values are interpreted during the creation of the list items for the day picker.
     class DAY_FORMAT(enum.Enum):
@@ -38,26 +90,38 @@ class DatePicker(urwid.WidgetWrap):
         ONLY_PAST = 2
         ONLY_FUTURE = 3
     
+    # Maps each 'DatePicker.DAY_FORMAT' element to a function, which creates the corresponding column of the day picker for the
+    # days 'start' to 'end' (included) of a month.
+    _DAY_COLUMN_BUILDERS = {DAY_FORMAT.DAY_OF_MONTH           : _day_of_month_column,
+                            DAY_FORMAT.DAY_OF_MONTH_TWO_DIGIT : _two_digit_day_of_month_column,
+                            DAY_FORMAT.WEEKDAY                : _weekday_column}
+    
     def __init__(self, initial_date=datetime.date.today(), *, date_range=RANGE.ALL, month_names=calendar.month_name, day_names=calendar.day_abbr,
                  day_format=(DAY_FORMAT.WEEKDAY, DAY_FORMAT.DAY_OF_MONTH), columns=(PICKER.DAY, PICKER.MONTH, PICKER.YEAR),
                  modifier_key=MODIFIER_KEY.CTRL, return_unused_navigation_input=False, year_jump_len=50, space_between=2, 
                  min_width_each_picker=9, year_align="center", month_align="center", day_align="center", topBar_align="center", 
                  topBar_endCovered_prop=("▲", None, None), topBar_endExposed_prop=("───", None, None), bottomBar_align="center",
                  bottomBar_endCovered_prop=("▼", None, None), bottomBar_endExposed_prop=("───", None, None), highlight_prop=(None, None)):
-        assert (type(date_range) == self.__class__.RANGE), self.__class__._TYPE_ERR_MSG.format("<enum 'DatePicker.RANGE'>",
-                                                                                               "'date_range'",
-                                                                                               type(date_range))
+        assert isinstance(date_range, self.__class__.RANGE), self.__class__._TYPE_ERR_MSG.format("<enum 'DatePicker.RANGE'>",
+                                                                                                 "'date_range'",
+                                                                                                 type(date_range))
+        
+        # The formats are iterated twice below, so an iterator is converted first.
+        day_format = tuple(day_format)
         
         for df in day_format:
-            assert (type(df) == self.__class__.DAY_FORMAT), self.__class__._TYPE_ERR_MSG.format("<enum 'DatePicker.DAY_FORMAT'>",
-                                                                                                "all elements of 'day_format'",
-                                                                                                type(df))
+            assert isinstance(df, self.__class__.DAY_FORMAT), self.__class__._TYPE_ERR_MSG.format("<enum 'DatePicker.DAY_FORMAT'>",
+                                                                                                  "all elements of 'day_format'",
+                                                                                                  type(df))
         
         # Relevant for 'RANGE.ONLY_PAST' and 'RANGE.ONLY_FUTURE' to limit the respective choices.
         self._initial_year = initial_date.year
         self._initial_month = initial_date.month
         self._initial_day = initial_date.day
         
+        # Used by 'set_date()' to test for the limit of the date range.
+        self._packed_initial_date = _pack_date(self._initial_year, self._initial_month, self._initial_day)
+        
         # The date pool can be limited, so that only past or future dates are selectable. The initial date is included in the
         # pool.
         self._date_range = date_range
@@ -68,8 +132,19 @@ class DatePicker(urwid.WidgetWrap):
         self._day_names = day_names
         
         # Since there are different needs regarding the appearance of the day picker, an iterable can be passed, which allows a
-        # customization of the presentation.
-        self._day_format = day_format
+        # customization of the presentation. The 'DatePicker.DAY_FORMAT' elements are translated into the functions that build the
+        # columns of the day picker only once. (See '_generate_days()'.)
+        day_column_builders = []
+        
+        for df in day_format:
+            build_column = self.__class__._DAY_COLUMN_BUILDERS.get(df)
+            
+            if build_column is None:
+                raise ValueError(self.__class__._VALUE_ERR_MSG.format(df))
+            
+            day_column_builders.append(build_column)
+        
+        self._day_column_builders = tuple(day_column_builders)
         
         # Specifies the text alignment of the individual pickers. The year alignment is passed directly to the year picker.
         self._month_align = month_align
@@ -79,6 +154,12 @@ class DatePicker(urwid.WidgetWrap):
         # highlighting, the normal value can be 'None' (it is never shown).
         self._item_attr = (None, highlight_prop[0])
         
+        # Set by 'set_date()' to regenerate the days only once. (See '_month_has_changed()'.)
+        self._day_update_suppressed = False
+        
+        # The recently displayed day picker items, by '(year, month)'. (See '_get_days()'.)
+        self._day_lists = {}
+        
         # A full list of months. (From 'January' to 'December'.)
         self._month_list = self._generate_months()
         
@@ -95,15 +176,16 @@ class DatePicker(urwid.WidgetWrap):
         elif date_range == self.__class__.RANGE.ONLY_PAST:
             max_year = self._initial_year
             
-            # The months of the very last year may be shorten.
-            self._shortened_month_list = self._generate_months(end=self._initial_month)
+            # The months of the very last year may be shorten. The items are taken over from the full list, since only one of the
+            # two lists is displayed at a time.
+            self._shortened_month_list = self._month_list[:self._initial_month]
             initial_month_list = self._shortened_month_list
             
         elif date_range == self.__class__.RANGE.ONLY_FUTURE:
             min_year = self._initial_year
             
-            # The months of the very first year may be shorten.
-            self._shortened_month_list = self._generate_months(start=self._initial_month)
+            # The months of the very first year may be shorten. (See above.)
+            self._shortened_month_list = self._month_list[self._initial_month - 1:]
             initial_month_list = self._shortened_month_list
             
             # The list may not start at 1 but some other day of month, therefore use the first list item.
@@ -113,20 +195,23 @@ class DatePicker(urwid.WidgetWrap):
         else:
             raise ValueError(self.__class__._VALUE_ERR_MSG.format(date_range))
         
+        # The pickers share the navigation and the appearance of the bars, so these arguments are collected only once.
+        shared_args = {"modifier_key"                   : modifier_key,
+                       "return_unused_navigation_input" : return_unused_navigation_input,
+                       "topBar_align"                   : topBar_align,
+                       "topBar_endCovered_prop"         : topBar_endCovered_prop,
+                       "topBar_endExposed_prop"         : topBar_endExposed_prop,
+                       "bottomBar_align"                : bottomBar_align,
+                       "bottomBar_endCovered_prop"      : bottomBar_endCovered_prop,
+                       "bottomBar_endExposed_prop"      : bottomBar_endExposed_prop}
+        
         # Create pickers.
         self._year_picker = IntegerPicker(self._initial_year,
                                           min_v=min_year,
                                           max_v=max_year,
                                           jump_len=year_jump_len,
                                           on_selection_change=self._year_has_changed,
-                                          modifier_key=modifier_key,
-                                          return_unused_navigation_input=return_unused_navigation_input,
-                                          topBar_align=topBar_align,
-                                          topBar_endCovered_prop=topBar_endCovered_prop,
-                                          topBar_endExposed_prop=topBar_endExposed_prop,
-                                          bottomBar_align=bottomBar_align,
-                                          bottomBar_endCovered_prop=bottomBar_endCovered_prop,
-                                          bottomBar_endExposed_prop=bottomBar_endExposed_prop,
+                                          **shared_args,
                                           display_syntax="{:04}",
                                           display_align=year_align,
                                           display_prop=highlight_prop)
@@ -134,26 +219,12 @@ class DatePicker(urwid.WidgetWrap):
         self._month_picker = IndicativeListBox(initial_month_list,
                                                position=month_position,
                                                on_selection_change=self._month_has_changed,
-                                               modifier_key=modifier_key,
-                                               return_unused_navigation_input=return_unused_navigation_input,
-                                               topBar_align=topBar_align,
-                                               topBar_endCovered_prop=topBar_endCovered_prop,
-                                               topBar_endExposed_prop=topBar_endExposed_prop,
-                                               bottomBar_align=bottomBar_align,
-                                               bottomBar_endCovered_prop=bottomBar_endCovered_prop,
-                                               bottomBar_endExposed_prop=bottomBar_endExposed_prop,
+                                               **shared_args,
                                                highlight_offFocus=highlight_prop[1])
         
-        self._day_picker = IndicativeListBox(self._generate_days(self._initial_year, self._initial_month),
+        self._day_picker = IndicativeListBox(self._get_days(self._initial_year, self._initial_month),
                                              position=day_position,
-                                             modifier_key=modifier_key,
-                                             return_unused_navigation_input=return_unused_navigation_input,
-                                             topBar_align=topBar_align,
-                                             topBar_endCovered_prop=topBar_endCovered_prop,
-                                             topBar_endExposed_prop=topBar_endExposed_prop,
-                                             bottomBar_align=bottomBar_align,
-                                             bottomBar_endCovered_prop=bottomBar_endCovered_prop,
-                                             bottomBar_endExposed_prop=bottomBar_endExposed_prop,
+                                             **shared_args,
                                              highlight_offFocus=highlight_prop[1])
         
         # To mimic a selection widget, 'IndicativeListbox' is wrapped in a 'urwid.BoxAdapter'. Since two rows are used for the bars,
@@ -201,47 +272,62 @@ class DatePicker(urwid.WidgetWrap):
         
         return months
     
+    # Returns the list items of the day picker for the given month. Recently displayed months are kept, so that navigating back
+    # and forth does not recreate the items every time. This is safe, because the day picker resets the highlighting of its
+    # items before its body is replaced, and it copies the passed list.
+    def _get_days(self, year, month):
+        day_lists = self._day_lists
+        key = (year, month)
+        days = day_lists.pop(key, None)
+        
+        if days is None:
+            days = self._generate_days(year, month)
+            
+            # Drop the least recently used month.
+            if len(day_lists) >= self.__class__._MAX_CACHED_DAY_LISTS:
+                del day_lists[next(iter(day_lists))]
+        
+        # (Re)inserting moves the month to the end, so that the order of the dict reflects the last use.
+        day_lists[key] = days
+        
+        return days
+    
     def _generate_days(self, year, month):
         start = 1
-        weekday, end = calendar.monthrange(year, month)         # end is included in the range
+        end = _month_length(year, month)                        # end is included in the range
+        
+        # Only the specified month can be shortened, so the date range is only evaluated for it.
+        if (year == self._initial_year) and (month == self._initial_month):
+            date_range = self._date_range
+            
+            # If the date range is 'ONLY_PAST', the last month does not end as usual but on the specified day.
+            if date_range == self.__class__.RANGE.ONLY_PAST:
+                end = self._initial_day
+            
+            # If the date range is 'ONLY_FUTURE', the first month does not start as usual but on the specified day.
+            elif date_range == self.__class__.RANGE.ONLY_FUTURE:
+                start = self._initial_day
         
-        # If the date range is 'ONLY_PAST', the last month does not end as usual but on the specified day.
-        if (self._date_range == self.__class__.RANGE.ONLY_PAST) and (year == self._initial_year) and (month == self._initial_month):
-            end = self._initial_day
+        day_count = end - start + 1
         
-        # If the date range is 'ONLY_FUTURE', the first month does not start as usual but on the specified day.
-        elif (self._date_range == self.__class__.RANGE.ONLY_FUTURE) and (year == self._initial_year) and (month == self._initial_month):
-            start = self._initial_day
-            weekday = calendar.weekday(year, month, start)
+        # Each column of the day picker is built for the whole month at once. (See '_DAY_COLUMN_BUILDERS'.)
+        columns = [build_column(self, year, month, start, end) for build_column in self._day_column_builders]
+        
+        # Without any column, each item is still created (with empty contents).
+        rows = zip(*columns) if columns else ([] for _ in range(day_count))
         
         days = []
         
-        for day in range(start, end+1):
-            cols = []
-            
-            # The 'DatePicker.DAY_FORMAT' elements of the iterable are translated into columns of the day picker. This allows the
-            # presentation to be customized.
-            for df in self._day_format:
-                if df == self.__class__.DAY_FORMAT.DAY_OF_MONTH:
-                    cols.append(str(day))
-                    
-                elif df == self.__class__.DAY_FORMAT.DAY_OF_MONTH_TWO_DIGIT:
-                    cols.append(str(day).zfill(2))
-                    
-                elif df == self.__class__.DAY_FORMAT.WEEKDAY:
-                    cols.append(self._day_names[weekday])
-                    
-                else:
-                    raise ValueError(self.__class__._VALUE_ERR_MSG.format(df))
-            
-            item = self._generate_item(cols, align=self._day_align)
+        # The loop runs up to 31 times, so the method and the alignment are looked up only once.
+        generate_item = self._generate_item
+        day_align = self._day_align
+        
+        for day, cols in zip(range(start, end+1), rows):
+            item = generate_item(list(cols), align=day_align)
             
             # Add a new instance variable which holds the numerical value. This makes it easier to get the displayed value.
             item._numerical_value = day
             
-            # Keeps track of the weekday.
-            weekday = (weekday + 1) if (weekday < 6) else 0
-            
             days.append(item)
         
         return days
@@ -271,36 +357,51 @@ class DatePicker(urwid.WidgetWrap):
                     
                 self._month_picker.set_body(self._shortened_month_list,
                                             alternative_position=provisional_position)
-    
+        
+        # Without weekdays, the days of a month only differ between two years of 'RANGE.ALL' if the length of the month does
+        # (i.e. February of a leap year). Otherwise the displayed days are kept.
+        elif _weekday_column not in self._day_column_builders:
+            month = self._month_picker.get_selected_item()._numerical_value
+            
+            if _month_length(previous_year, month) == _month_length(current_year, month):
+                return
+        
         # Since the month has changed, the corresponding method is called.
         self._month_has_changed(month_position_before_change,
                                 self._month_picker.get_selected_position(),
                                 previous_year=previous_year)
     
     def _month_has_changed(self, previous_position, current_position, *, previous_year=None):
+        # While 'set_date()' changes the year and the month, the days are regenerated by it afterwards.
+        if self._day_update_suppressed:
+            return
+        
         # 'None' stands for trying to keep the old value.
         provisional_position = None
         
         current_year = self._year_picker.get_value()
+        day_picker = self._day_picker
         
         # Out of range values are changed by 'IndicativeListBox' to the nearest valid values.
         
         # If the date range is 'ONLY_FUTURE', it may be that a month does not start on the first day. In this case, the value must
         # be changed to reflect this difference.
         if self._date_range == self.__class__.RANGE.ONLY_FUTURE:
+            initial_year = self._initial_year
+            
             # If the current or previous year is the specified year and the month was the specified month, the value has an offset
             # of the specified day. Therefore the deposited numerical value is used. ('-1' because it's an index.)
-            if ((current_year == self._initial_year) or (previous_year == self._initial_year)) and (previous_position == 0):
-                provisional_position = self._day_picker.get_selected_item()._numerical_value - 1
+            if ((current_year == initial_year) or (previous_year == initial_year)) and (previous_position == 0):
+                provisional_position = day_picker.get_selected_item()._numerical_value - 1
             
             # If the current year is the specified year and the current month is the specified month, the month begins not with 
             # the first day, but with the specified day.
-            elif (current_year == self._initial_year) and (current_position == 0):
-                provisional_position = self._day_picker.get_selected_position() - (self._initial_day - 1)
+            elif (current_year == initial_year) and (current_position == 0):
+                provisional_position = day_picker.get_selected_position() - (self._initial_day - 1)
             
-        self._day_picker.set_body(self._generate_days(current_year,
-                                                      self._month_picker.get_selected_item()._numerical_value),
-                                  alternative_position=provisional_position)
+        day_picker.set_body(self._get_days(current_year,
+                                           self._month_picker.get_selected_item()._numerical_value),
+                            alternative_position=provisional_position)
         
     def get_date(self):
         return datetime.date(self._year_picker.get_value(),
@@ -308,32 +409,55 @@ class DatePicker(urwid.WidgetWrap):
                              self._day_picker.get_selected_item()._numerical_value)
         
     def set_date(self, date):
-        # If the date range is limited, test for the new limit.
-        if self._date_range != self.__class__.RANGE.ALL:
-            limit = datetime.date(self._initial_year, self._initial_month, self._initial_day)
+        year = date.year
+        month = date.month
+        day = date.day
+        
+        # If the date is already selected, there is nothing to do. (The selected date is always within the date range.)
+        if ((year == self._year_picker.get_value())
+                and (month == self._month_picker.get_selected_item()._numerical_value)
+                and (day == self._day_picker.get_selected_item()._numerical_value)):
+            return
+        
+        # If the date range is limited, test for the new limit. The dates are compared as packed integers. (See '_pack_date()'.)
+        date_range = self._date_range
+        
+        if date_range != self.__class__.RANGE.ALL:
+            packed_date = _pack_date(year, month, day)
             
-            if (self._date_range == self.__class__.RANGE.ONLY_PAST) and (date > limit):
+            if (date_range == self.__class__.RANGE.ONLY_PAST) and (packed_date > self._packed_initial_date):
                 raise ValueError("The passed date is outside the upper bound of the date range.")
             
-            elif (self._date_range == self.__class__.RANGE.ONLY_FUTURE) and (date < limit):
+            elif (date_range == self.__class__.RANGE.ONLY_FUTURE) and (packed_date < self._packed_initial_date):
                 raise ValueError("The passed date is outside the lower bound of the date range.")
-            
-        year = date.year
-        month = date.month
-        day = date.day
         
-        # Set the new values, if needed.
-        if year != self._year_picker.get_value():
-            self._year_picker.set_value(year)
+        # Changing the year or the month normally regenerates the days. If both change, this would happen twice, so the days are
+        # regenerated only once, after both have been set. (See '_month_has_changed()'.)
+        self._day_update_suppressed = True
         
-        if month != self._month_picker.get_selected_item()._numerical_value:
-            month_position = month - 1          # '-1' because it's an index.
+        try:
+            # Set the new values, if needed.
+            year_has_changed = year != self._year_picker.get_value()
+            
+            if year_has_changed:
+                self._year_picker.set_value(year)
             
-            if (self._date_range == self.__class__.RANGE.ONLY_FUTURE) and (year == self._initial_year):
-                # If the value should be negative, the behavior of 'IndicativeListBox' shows effect and position 0 is selected.
-                month_position = month_position - (self._initial_month - 1)
+            month_has_changed = month != self._month_picker.get_selected_item()._numerical_value
             
-            self._month_picker.select_item(month_position)
+            if month_has_changed:
+                month_position = month - 1          # '-1' because it's an index.
+                
+                if (self._date_range == self.__class__.RANGE.ONLY_FUTURE) and (year == self._initial_year):
+                    # If the value should be negative, the behavior of 'IndicativeListBox' shows effect and position 0 is
+                    # selected.
+                    month_position = month_position - (self._initial_month - 1)
+                
+                self._month_picker.select_item(month_position)
+        finally:
+            self._day_update_suppressed = False
+        
+        if year_has_changed or month_has_changed:
+            self._day_picker.set_body(self._get_days(year, month))
         
         if day != self._day_picker.get_selected_item()._numerical_value:
             day_position = day - 1              # '-1' because it's an index.
@@ -342,4 +466,3 @@ class DatePicker(urwid.WidgetWrap):
                 day_position = day_position - (self._initial_day - 1)
             
             self._day_picker.select_item(day_position)
-    
\ No newline at end of file
@@ -3,34 +3,108 @@
 
 
 from ..assisting_modules.modifier_key import MODIFIER_KEY        # pylint: disable=unused-import
+from ..assisting_modules.useful_functions import shared_attr_map
 
 import enum
-import random
 import urwid
 
 
+def _random_position(body_len):
+    # 'random' is imported only here, since most list boxes never need it.
+    import random
+    
+    return random.randint(0, body_len - 1)
+
+
+class _CachingListBox(urwid.ListBox):
+    """A 'urwid.ListBox' that can reuse the result of 'calculate_visible()' for its next rendering, since 'render()' would
+    otherwise calculate the same again."""
+    
+    def __init__(self, body):
+        super().__init__(body)
+        self._visible_memo = None
+    
+    def calculate_visible(self, size, focus=False):
+        memo = self._visible_memo
+        
+        # The memorized result is handed out only once, because 'render()' modifies it.
+        if memo is not None:
+            self._visible_memo = None
+            
+            if (memo[0] == size) and (memo[1] == focus):
+                return memo[2]
+        
+        return super().calculate_visible(size, focus)
+    
+    # Calculates which items are visible and memorizes the result for the next call of 'calculate_visible()'.
+    def memorize_visible(self, size, focus=False):
+        visible = super().calculate_visible(size, focus)
+        self._visible_memo = (size, focus, visible)
+        return visible
+    
+    def forget_visible(self):
+        self._visible_memo = None
+
+
+class _BodyLength:
+    """Determines the length of the body of an 'IndicativeListBox' on every access. Since this is a non-data descriptor, an
+    instance attribute of the same name takes precedence, which is used to cache the length of a body that signals its
+    modifications."""
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        
+        return len(instance._listbox.body)
+
+
 class IndicativeListBox(urwid.WidgetWrap):
     """Adds two bars to a 'urwid.ListBox', that make it obvious that due to limited space only a part of the list items is displayed."""
 
-    _TYPE_ERR_MSG = "type {} was expected for {}, but found: {}."
-    _VALUE_ERR_MSG = "unrecognized value: {}."
-
-    # These values are translated by 'get_nearest_valid_position()' into the corresponding int values.
+    # The length of the body, unless it is cached by '__init__()'.
+    _body_len = _BodyLength()
+    
+    # These values are translated by '_get_nearest_valid_position()' into the corresponding int values.
     class POSITION(enum.Enum):
         LAST = 1
         MIDDLE = 2
         RANDOM = 3
+    
+    # Translates the members of 'POSITION' into the corresponding int values, assuming that the body is not empty.
+    _POSITION_RESOLVERS = {POSITION.LAST   : lambda self: self._body_len - 1,
+                           POSITION.MIDDLE : lambda self: self._body_len // 2,
+                           POSITION.RANDOM : lambda self: _random_position(self._body_len)}
+    
+    # Maps '(last focus state, focus)' to what has to be done with the off focus highlighting of the selected item. The last focus
+    # state is None before the first rendering. All other combinations require no action.
+    _HIGHLIGHT_ACTIONS = {(False, True) : "restore",
+                          (None, True)  : "restore",
+                          (True, False) : "apply",
+                          (None, False) : "apply"}
         
     def __init__(self, body, *, position=0, on_selection_change=None, initialization_is_selection_change=False,
                  modifier_key=MODIFIER_KEY.NONE, return_unused_navigation_input=True, topBar_align="center",
                  topBar_endCovered_prop=("▲", None, None), topBar_endExposed_prop=("───", None, None), bottomBar_align="center",
                  bottomBar_endCovered_prop=("▼", None, None), bottomBar_endExposed_prop=("───", None, None), highlight_offFocus=None):
         # If not already done, wrap each item of the body in an 'urwid.AttrMap'. This is necessary to enable off focus highlighting.
-        body[:] = [urwid.AttrMap(item, None) if not isinstance(item, urwid.AttrMap) else item
-                   for item in body]
+        self._wrap_body_inplace(body)
+        
+        # The body of the 'urwid.Frame' is a 'urwid.ListBox'. (See '_CachingListBox'.)
+        self._listbox = _CachingListBox(body)
         
-        # The body of the 'urwid.Frame' is a 'urwid.ListBox'.
-        self._listbox = urwid.ListBox(body)
+        # The methods of the list box which are used on every rendering or input are bound only once.
+        self._listbox_memorize_visible = self._listbox.memorize_visible
+        self._listbox_render = self._listbox.render
+        self._listbox_keypress = self._listbox.keypress
+        self._listbox_mouse_event = self._listbox.mouse_event
+        
+        # The length of the body is queried several times per keypress. A body based on 'urwid.MonitoredList' (e.g.
+        # 'urwid.SimpleFocusListWalker') signals every modification, so its length is cached and kept up to date, even if the body
+        # is modified from outside. Other list walkers are not required to do so, therefore their length is determined on every
+        # access. (See '_BodyLength'.)
+        if isinstance(self._listbox.body, urwid.MonitoredList):
+            self._body_len = len(self._listbox.body)
+            urwid.connect_signal(self._listbox.body, "modified", self._on_body_modified)
         
         # Select the specified list position, or the nearest valid one.
         nearest_valid_position = self._get_nearest_valid_position(position)
@@ -45,6 +119,20 @@ class IndicativeListBox(urwid.WidgetWrap):
         self._bottom_bar = urwid.AttrMap(urwid.Text("", align=bottomBar_align),
                                          None)
         
+        # The markups and attribute maps which are currently used by the bars.
+        self._topBar_markup = ""
+        self._bottomBar_markup = ""
+        self._topBar_attr_map = None
+        self._bottomBar_attr_map = None
+        
+        # The number of rows of both bars only changes if the number of columns or the markups change. Therefore, it is
+        # calculated once and then reused. (See '_get_bar_rows()'.)
+        self._bar_rows_key = None
+        self._bar_rows = None
+        
+        # Used by 'render()' to stack the canvases of the bars and the list box.
+        self._combine_list = [None, None, None]
+        
         # Wrap 'urwid.Frame'.
         super().__init__(urwid.Frame(self._listbox,
                                      header=self._top_bar,
@@ -52,25 +140,26 @@ class IndicativeListBox(urwid.WidgetWrap):
                                      focus_part="body"))
         
         # During the initialization of 'urwid.AttrMap', the value can be passed as non-dict. After initializing, its value can be
-        # manipulated by passing a dict. The dicts I create below will be used later to change the appearance of the bars.
+        # manipulated by passing a dict. The dicts I fetch below (see 'shared_attr_map()') will be used later to change the
+        # appearance of the bars. Each pair is stored as '(off focus, focus)', so that it can be indexed directly by the focus flag.
         self._topBar_endCovered_markup = topBar_endCovered_prop[0]
-        self._topBar_endCovered_focus = {None:topBar_endCovered_prop[1]}
-        self._topBar_endCovered_offFocus = {None:topBar_endCovered_prop[2]}
+        self._topBar_endCovered_attrMaps = (shared_attr_map(topBar_endCovered_prop[2]),    # off focus
+                                            shared_attr_map(topBar_endCovered_prop[1]))    # focus
         
         self._topBar_endExposed_markup = topBar_endExposed_prop[0]
-        self._topBar_endExposed_focus = {None:topBar_endExposed_prop[1]}
-        self._topBar_endExposed_offFocus = {None:topBar_endExposed_prop[2]}
+        self._topBar_endExposed_attrMaps = (shared_attr_map(topBar_endExposed_prop[2]),    # off focus
+                                            shared_attr_map(topBar_endExposed_prop[1]))    # focus
         
         self._bottomBar_endCovered_markup = bottomBar_endCovered_prop[0]
-        self._bottomBar_endCovered_focus = {None:bottomBar_endCovered_prop[1]}
-        self._bottomBar_endCovered_offFocus = {None:bottomBar_endCovered_prop[2]}
+        self._bottomBar_endCovered_attrMaps = (shared_attr_map(bottomBar_endCovered_prop[2]),    # off focus
+                                               shared_attr_map(bottomBar_endCovered_prop[1]))    # focus
         
         self._bottomBar_endExposed_markup = bottomBar_endExposed_prop[0]
-        self._bottomBar_endExposed_focus = {None:bottomBar_endExposed_prop[1]}
-        self._bottomBar_endExposed_offFocus = {None:bottomBar_endExposed_prop[2]}
+        self._bottomBar_endExposed_attrMaps = (shared_attr_map(bottomBar_endExposed_prop[2]),    # off focus
+                                               shared_attr_map(bottomBar_endExposed_prop[1]))    # focus
         
         # This is used to highlight the selected item when the widget does not have the focus.
-        self._highlight_offFocus = {None:highlight_offFocus}
+        self._highlight_offFocus = shared_attr_map(highlight_offFocus)
         self._last_focus_state = None
         self._original_item_attr_map = None
         
@@ -83,6 +172,17 @@ class IndicativeListBox(urwid.WidgetWrap):
         # 'MODIFIER_KEY' changes the behavior of the list box, so that it responds only to modified input. ('up' => 'ctrl up')
         self._modifier_key = modifier_key
         
+        # The modified keystrokes are built only once. Each of them is mapped to the bound method which handles it and to the
+        # corresponding unmodified keystroke, which is understood by the contained list box. The same applies to the modified
+        # mouse event.
+        self._navigation_handlers = {modifier_key.prepend_to("up")        : (self._navigate_listbox, "up"),
+                                     modifier_key.prepend_to("down")      : (self._navigate_listbox, "down"),
+                                     modifier_key.prepend_to("page up")   : (self._navigate_listbox, "page up"),
+                                     modifier_key.prepend_to("page down") : (self._navigate_listbox, "page down"),
+                                     modifier_key.prepend_to("home")      : (self._navigate_to_first_item, "home"),
+                                     modifier_key.prepend_to("end")       : (self._navigate_to_last_item, "end")}
+        self._modified_mouse_press = modifier_key.prepend_to("mouse press")
+        
         # If the list item at the top is selected and you navigate further upwards, the input is normally not swallowed by the
         # list box, but passed on so that other widgets can interpret it. This may result in transferring the focus.
         self._return_unused_navigation_input = return_unused_navigation_input
@@ -93,20 +193,21 @@ class IndicativeListBox(urwid.WidgetWrap):
                                 self.get_selected_position())
     
     def __repr__(self):
-        return "{}(body='{}', position='{}')".format(self.__class__.__name__,
-                                                     self.get_body(),
-                                                     self.get_selected_position())
+        return f"{self.__class__.__name__}(body='{self.get_body()}', position='{self.get_selected_position()}')"
     
     def render(self, size, focus=False):
-        just_maxcol = (size[0],)
+        topBar_rows, bottomBar_rows = self._get_bar_rows(size[0])
         
         # The size also includes the two bars, so subtract these.
-        modified_size = (size[0],                                                                           # cols
-                         size[1] - self._top_bar.rows(just_maxcol) - self._bottom_bar.rows(just_maxcol))    # rows
+        modified_size = (size[0],                                   # cols
+                         size[1] - topBar_rows - bottomBar_rows)    # rows
         
         # Evaluates which ends are visible and calculates how many list entries are hidden above/below. This is a modified form
-        # of 'urwid.ListBox.ends_visible()'.
-        middle, top, bottom = self._listbox.calculate_visible(modified_size, focus=focus)
+        # of 'urwid.ListBox.ends_visible()'. For an empty body, both ends are visible without asking the list box.
+        if self._body_len == 0:
+            middle = None
+        else:
+            middle, top, bottom = self._listbox_memorize_visible(modified_size, focus=focus)
         
         if middle is None:                      # empty list box
             top_is_visible = True
@@ -115,6 +216,10 @@ class IndicativeListBox(urwid.WidgetWrap):
         else:
             top_is_visible = False
             bottom_is_visible = False
+            
+            # The helper methods ('rearmost_position()' etc.) are inlined here, because this runs on every rendering.
+            body = self._listbox.body
+            last_position = self._body_len - 1
         
             trim_top, above = top
             trim_bottom, below = bottom
@@ -122,12 +227,12 @@ class IndicativeListBox(urwid.WidgetWrap):
             if trim_top == 0:
                 pos = above[-1][1] if (len(above) != 0) else middle[2]
                 
-                if self._listbox._body.get_prev(pos) == (None,None):
+                if body.get_prev(pos) == (None,None):
                     top_is_visible = True
                 else:
                     covered_above = pos
             else:
-                covered_above = self.rearmost_position()
+                covered_above = last_position
             
             if trim_bottom == 0:
                 row_offset, _, pos, rows, _ = middle
@@ -137,45 +242,59 @@ class IndicativeListBox(urwid.WidgetWrap):
                 for _, pos, rows in below:      # 'pos' is overridden
                     row_offset += rows
                     
-                if (row_offset < modified_size[1]) or (self._listbox._body.get_next(pos) == (None, None)):
+                if (row_offset < modified_size[1]) or (body.get_next(pos) == (None, None)):
                     bottom_is_visible = True
                 else:
-                    covered_below = self.rearmost_position() - pos
+                    covered_below = last_position - pos
             else:
-                covered_below = self.rearmost_position()
+                covered_below = last_position
         
         # Changes the appearance of the bar at the top depending on whether the first list item is visible and the widget has
         # the focus.
         if top_is_visible:
-            self._top_bar.original_widget.set_text(self._topBar_endExposed_markup)
-            self._top_bar.set_attr_map(self._topBar_endExposed_focus
-                                       if focus else self._topBar_endExposed_offFocus)
+            topBar_markup = self._topBar_endExposed_markup
+            topBar_attr_map = self._topBar_endExposed_attrMaps[focus]
         else:
-            self._top_bar.original_widget.set_text(self._topBar_endCovered_markup.format(covered_above))
-            self._top_bar.set_attr_map(self._topBar_endCovered_focus
-                                       if focus else self._topBar_endCovered_offFocus)
+            topBar_markup = self._topBar_endCovered_markup.format(covered_above)
+            topBar_attr_map = self._topBar_endCovered_attrMaps[focus]
         
         # Changes the appearance of the bar at the bottom depending on whether the last list item is visible and the widget
         # has the focus.
         if bottom_is_visible:
-            self._bottom_bar.original_widget.set_text(self._bottomBar_endExposed_markup)
-            self._bottom_bar.set_attr_map(self._bottomBar_endExposed_focus
-                                          if focus else self._bottomBar_endExposed_offFocus)
+            bottomBar_markup = self._bottomBar_endExposed_markup
+            bottomBar_attr_map = self._bottomBar_endExposed_attrMaps[focus]
         else:
-            self._bottom_bar.original_widget.set_text(self._bottomBar_endCovered_markup.format(covered_below))
-            self._bottom_bar.set_attr_map(self._bottomBar_endCovered_focus
-                                          if focus else self._bottomBar_endCovered_offFocus)
+            bottomBar_markup = self._bottomBar_endCovered_markup.format(covered_below)
+            bottomBar_attr_map = self._bottomBar_endCovered_attrMaps[focus]
+        
+        # The bars are only updated if their appearance has really changed. Otherwise, their cached canvases would be invalidated
+        # on every redraw.
+        if topBar_markup != self._topBar_markup:
+            self._topBar_markup = topBar_markup
+            self._top_bar.original_widget.set_text(topBar_markup)
+        
+        if topBar_attr_map is not self._topBar_attr_map:
+            self._topBar_attr_map = topBar_attr_map
+            self._top_bar.set_attr_map(topBar_attr_map)
+        
+        if bottomBar_markup != self._bottomBar_markup:
+            self._bottomBar_markup = bottomBar_markup
+            self._bottom_bar.original_widget.set_text(bottomBar_markup)
+        
+        if bottomBar_attr_map is not self._bottomBar_attr_map:
+            self._bottomBar_attr_map = bottomBar_attr_map
+            self._bottom_bar.set_attr_map(bottomBar_attr_map)
         
         # The highlighting in urwid is bound to the focus. This means that the selected item is only distinguishable as long as
         # the widget has the focus. To compensate this, the color scheme of the selected item is otherwiese temporarily changed.
-        if focus and not self._last_focus_state and (self._original_item_attr_map is not None):
+        # Only a change of the focus (or the first rendering) requires an action. (See '_HIGHLIGHT_ACTIONS'.)
+        highlight_action = self.__class__._HIGHLIGHT_ACTIONS.get((self._last_focus_state, focus))
+        
+        if (highlight_action == "restore") and (self._original_item_attr_map is not None):
             # Resets the appearance of the selected item to its original value.
             self._listbox.focus.set_attr_map(self._original_item_attr_map)
             
-        elif (self._highlight_offFocus is not None) \
-                    and not focus \
-                    and (self._last_focus_state or (self._last_focus_state is None)) \
-                    and not self.body_is_empty():
+        elif (highlight_action == "apply") and (self._body_len != 0):
             # Store the 'attr_map' of the selected item and then change it to accomplish off focus highlighting.
             self._original_item_attr_map = self._listbox.focus.get_attr_map()
             self._listbox.focus.set_attr_map(self._highlight_offFocus)
@@ -184,53 +303,50 @@ class IndicativeListBox(urwid.WidgetWrap):
         # widget is re-rendered because the terminal size has changed or similar.
         self._last_focus_state = focus
         
-        return super().render(size, focus=focus)
+        # If there is not enough space for both bars and at least one row of the list box, 'urwid.Frame' has to decide how the
+        # bars are trimmed. The same applies if the new markups need a different number of rows than the ones the size of the
+        # list box was calculated with (e.g. if they wrap).
+        if (modified_size[1] <= 0) or (self._get_bar_rows(size[0]) != (topBar_rows, bottomBar_rows)):
+            self._listbox.forget_visible()
+            return super().render(size, focus=focus)
+        
+        # Otherwise, the canvases are stacked directly, because the rows of the bars are already known. The list passed to
+        # 'urwid.CanvasCombine()' is reused, since it is not retained.
+        combine_list = self._combine_list
+        combine_list[0] = (self._top_bar.render((size[0],)), "header", False)
+        combine_list[1] = (self._listbox_render(modified_size, focus), "body", True)
+        
+        # If the canvas of the list box was taken from urwid's cache, the memorized result has not been used.
+        self._listbox.forget_visible()
+        combine_list[2] = (self._bottom_bar.render((size[0],)), "footer", False)
+        
+        return urwid.CanvasCombine(combine_list)
     
     def keypress(self, size, key):
-        just_maxcol = (size[0],)
+        topBar_rows, bottomBar_rows = self._get_bar_rows(size[0])
         
         # The size also includes the two bars, so subtract these.
-        modified_size = (size[0],                                                                           # cols
-                         size[1] - self._top_bar.rows(just_maxcol) - self._bottom_bar.rows(just_maxcol))    # rows
+        modified_size = (size[0],                                   # cols
+                         size[1] - topBar_rows - bottomBar_rows)    # rows
         
         # Store the focus position before passing the keystroke to the contained list box. That way, it can be compared with the 
-        # position after the input is processed. If the list box body is empty, store None.
-        focus_position_before_input = self.get_selected_position()
+        # position after the input is processed. If the list box body is empty, store None. (This is the same as
+        # 'get_selected_position()', but avoids the method calls on every keystroke.)
+        listbox = self._listbox
+        focus_position_before_input = listbox.focus_position if self._body_len else None
         
         # A keystroke is changed to a modified one ('up' => 'ctrl up'). This prevents the widget from responding when the arrows
         # keys are used to navigate between widgets. That way it can be used in a 'urwid.Pile' or similar.
-        if key == self._modifier_key.prepend_to("up"):
-            key = self._pass_key_to_contained_listbox(modified_size, "up")
-            
-        elif key == self._modifier_key.prepend_to("down"):
-            key = self._pass_key_to_contained_listbox(modified_size, "down")
-            
-        elif key == self._modifier_key.prepend_to("page up"):
-            key = self._pass_key_to_contained_listbox(modified_size, "page up")
-            
-        elif key == self._modifier_key.prepend_to("page down"):
-            key = self._pass_key_to_contained_listbox(modified_size, "page down")
+        navigation_handler = self._navigation_handlers.get(key)
+        
+        if navigation_handler is not None:
+            handler, navigation_key = navigation_handler
+            key = handler(modified_size, key, navigation_key, focus_position_before_input)
             
-        elif key == self._modifier_key.prepend_to("home"):
-            # Check if the first list item is already selected.
-            if (focus_position_before_input is not None) and (focus_position_before_input != 0):
-                self.select_first_item()
-                key = None
-            elif not self._return_unused_navigation_input:
-                key = None
-                
-        elif key == self._modifier_key.prepend_to("end"):
-            # Check if the last list item is already selected.
-            if (focus_position_before_input is not None) and (focus_position_before_input != self.rearmost_position()):
-                self.select_last_item()
-                key = None
-            elif not self._return_unused_navigation_input:
-                key = None
-                
-        elif key not in ("up", "down", "page up", "page down", "home", "end"):
-            key = self._listbox.keypress(modified_size, key)
+        elif key not in {"up", "down", "page up", "page down", "home", "end"}:
+            key = self._listbox_keypress(modified_size, key)
         
-        focus_position_after_input = self.get_selected_position()
+        focus_position_after_input = listbox.focus_position if self._body_len else None
         
         # If the focus position has changed, execute the hook (if existing).
         if (focus_position_before_input != focus_position_after_input) and (self.on_selection_change is not None):
@@ -240,10 +356,7 @@ class IndicativeListBox(urwid.WidgetWrap):
         return key
     
     def mouse_event(self, size, event, button, col, row, focus):
-        just_maxcol = (size[0],)
-        
-        topBar_rows = self._top_bar.rows(just_maxcol)
-        bottomBar_rows = self._bottom_bar.rows(just_maxcol)
+        topBar_rows, bottomBar_rows = self._get_bar_rows(size[0])
         
         # The size also includes the two bars, so subtract these.
         modified_size = (size[0],                                   # cols
@@ -253,26 +366,28 @@ class IndicativeListBox(urwid.WidgetWrap):
         
         # An event is changed to a modified one ('mouse press' => 'ctrl mouse press'). This prevents the widget from responding
         # when mouse buttons are also used to navigate between widgets.
-        if event == self._modifier_key.prepend_to("mouse press"):
+        if event == self._modified_mouse_press:
             # Store the focus position before passing the input to the contained list box. That way, it can be compared with the 
-            # position after the input is processed. If the list box body is empty, store None.
-            focus_position_before_input = self.get_selected_position()
+            # position after the input is processed. If the list box body is empty, store None. (This is the same as
+            # 'get_selected_position()', but avoids the method calls.)
+            listbox = self._listbox
+            focus_position_before_input = listbox.focus_position if self._body_len else None
             
             # left mouse button, if not top bar or bottom bar.
-            if (button == 1.0) and (topBar_rows <= row < (size[1] - bottomBar_rows)):
+            if (button == 1) and (topBar_rows <= row < (size[1] - bottomBar_rows)):
                 # Because 'row' includes the top bar, the offset must be substracted before passing it to the contained list box.
-                result = self._listbox.mouse_event(modified_size, event, button, col, (row - topBar_rows), focus)
+                result = self._listbox_mouse_event(modified_size, event, button, col, (row - topBar_rows), focus)
                 was_handeled = result if self._return_unused_navigation_input else True
             
             # mousewheel up
-            elif button == 4.0:
+            elif button == 4:
                 was_handeled = self._pass_key_to_contained_listbox(modified_size, "page up")
                 
             # mousewheel down
-            elif button == 5.0:
+            elif button == 5:
                 was_handeled = self._pass_key_to_contained_listbox(modified_size, "page down")
                 
-            focus_position_after_input = self.get_selected_position()
+            focus_position_after_input = listbox.focus_position if self._body_len else None
             
             # If the focus position has changed, execute the hook (if existing).
             if (focus_position_before_input != focus_position_after_input) and (self.on_selection_change is not None):
@@ -281,67 +396,97 @@ class IndicativeListBox(urwid.WidgetWrap):
         
         return was_handeled
     
+    # Returns the number of rows of the top bar and the bottom bar for the passed number of columns.
+    def _get_bar_rows(self, maxcol):
+        key = (maxcol, self._topBar_markup, self._bottomBar_markup)
+        
+        if key != self._bar_rows_key:
+            self._bar_rows_key = key
+            self._bar_rows = (self._top_bar.rows((maxcol,)),
+                              self._bottom_bar.rows((maxcol,)))
+            
+        return self._bar_rows
+    
+    # The navigation handlers used by 'keypress()'. Each of them returns the keystroke, if it is not used.
+    def _navigate_listbox(self, size, key, navigation_key, focus_position):
+        return self._pass_key_to_contained_listbox(size, navigation_key)
+    
+    def _navigate_to_first_item(self, size, key, navigation_key, focus_position):
+        # Check if the first list item is already selected.
+        if (focus_position is not None) and (focus_position != 0):
+            self.select_first_item()
+            return None
+        
+        return key if self._return_unused_navigation_input else None
+    
+    def _navigate_to_last_item(self, size, key, navigation_key, focus_position):
+        # Check if the last list item is already selected.
+        if (focus_position is not None) and (focus_position != self._body_len - 1):
+            self.select_last_item()
+            return None
+        
+        return key if self._return_unused_navigation_input else None
+    
     # Pass the keystroke to the original widget. If it is not used, evaluate the corresponding variable to decide if it gets
     # swallowed or not.
     def _pass_key_to_contained_listbox(self, size, key):
-        result = self._listbox.keypress(size, key)
+        result = self._listbox_keypress(size, key)
         return result if self._return_unused_navigation_input else None
     
+    def _on_body_modified(self):
+        self._body_len = len(self._listbox.body)
+    
     def get_body(self):
         return self._listbox.body
     
     def body_len(self):
-        return len(self.get_body())
+        return self._body_len
     
     def rearmost_position(self):
-        return len(self.get_body()) - 1           # last valid index
+        return self._body_len - 1           # last valid index
     
     def body_is_empty(self):
-        return self.body_len() == 0
+        return self._body_len == 0
     
     def position_is_valid(self, position):
-        return (position < self.body_len()) and (position >= 0)
+        return 0 <= position < self._body_len
     
     # If the passed position is valid, it is returned. Otherwise, the nearest valid position is returned. This ensures that
     # positions which are out of range do not result in an error.
     def _get_nearest_valid_position(self, position):
-        if self.body_is_empty():
+        body_len = self._body_len
+        
+        if body_len == 0:
             return None
         
         pos_type = type(position)
         
-        if pos_type == int:
-            if self.position_is_valid(position):
-                return position
-            
-            elif position < 0:
+        # Integers are the common case, so they are checked first and clamped directly.
+        if pos_type is int:
+            if position < 0:
                 return 0
             
-            else:
-                return self.rearmost_position()
+            elif position < body_len:
+                return position
             
-        elif pos_type == self.__class__.POSITION:
-            if position == self.__class__.POSITION.LAST:
-                return self.rearmost_position()
-                
-            elif position == self.__class__.POSITION.MIDDLE:
-                return self.body_len() // 2
-                
-            elif position == self.__class__.POSITION.RANDOM:
-                return random.randint(0, self.rearmost_position())
-                
             else:
-                raise ValueError(self.__class__._VALUE_ERR_MSG.format(position))
+                return body_len - 1
+            
+        elif pos_type is self.__class__.POSITION:
+            position_resolver = self.__class__._POSITION_RESOLVERS.get(position)
+            
+            if position_resolver is None:
+                raise ValueError(f"unrecognized value: {position}.")
+            
+            return position_resolver(self)
             
         else:
-            raise TypeError(self.__class__._TYPE_ERR_MSG.format("<class 'int'> or <enum 'IndicativeListBox.POSITION'>",
-                                                                "'position'",
-                                                                pos_type))
+            raise TypeError(f"type <class 'int'> or <enum 'IndicativeListBox.POSITION'> was expected for 'position', but found: "
+                            f"{pos_type}.")
             
     def get_item(self, position):
-        if self.position_is_valid(position):
-            body = self.get_body()
-            return body[position]
+        if 0 <= position < self._body_len:
+            return self._listbox.body[position]
         else:
             return None
     
@@ -349,19 +494,31 @@ class IndicativeListBox(urwid.WidgetWrap):
         return self.get_item(0)
     
     def get_last_item(self):
-        return self.get_item(self.rearmost_position())
+        return self.get_item(self._body_len - 1)
     
     def get_selected_item(self):
         return self._listbox.focus
     
     def get_selected_position(self):
-        return self._listbox.focus_position if not self.body_is_empty() else None
+        return self._listbox.focus_position if self._body_len else None
     
+    # For an empty body, neither the first nor the last item is selected.
     def first_item_is_selected(self):
-        return self.get_selected_position() == 0
+        return (self._body_len != 0) and (self._listbox.focus_position == 0)
     
     def last_item_is_selected(self):
-        return self.get_selected_position() == self.rearmost_position()
+        body_len = self._body_len
+        return (body_len != 0) and (self._listbox.focus_position == body_len - 1)
+    
+    @staticmethod
+    def _wrap_body_inplace(body):
+        # The body is changed in place and items which are already wrapped are left untouched. A list walker that creates its
+        # items on demand can not be changed in place, so it is expected to return wrapped items. Iterating over it would
+        # create every item at once.
+        if hasattr(body, "__setitem__"):
+            for i, item in enumerate(body):
+                if not isinstance(item, urwid.AttrMap):
+                    body[i] = urwid.AttrMap(item, None)
     
     def _reset_highlighting(self):
         # Resets the appearance of the selected item to its original value, if off focus highlighting is active.
@@ -377,7 +534,8 @@ class IndicativeListBox(urwid.WidgetWrap):
         
         self._reset_highlighting()
         
-        # Wrap each item in an 'urwid.AttrMap', if not already done.
+        # Replace the items and wrap each of them in an 'urwid.AttrMap', if not already done. Either way, the body of the list box
+        # is modified only once. The items are read in a single pass, so that the body can also be passed as an iterator.
         self._listbox.body[:] = [urwid.AttrMap(item, None) if not isinstance(item, urwid.AttrMap) else item
                                  for item in body]
         
@@ -385,10 +543,10 @@ class IndicativeListBox(urwid.WidgetWrap):
         if alternative_position is not None:
             nearest_valid_position = self._get_nearest_valid_position(alternative_position)
             
+            # The highlighting has already been reset above, so the focus can be moved right away.
+            assert (self._original_item_attr_map is None), "the highlighting must be reset before the focus is moved."
+            
             if nearest_valid_position is not None:
-                # Because the widget has been re-rendered, the off focus highlighted item must be restored to its original state.
-                self._reset_highlighting()
-                
                 self._listbox.set_focus(nearest_valid_position)
         
         # If an initialization is considered a selection change, execute the hook (if existing).
@@ -397,7 +555,8 @@ class IndicativeListBox(urwid.WidgetWrap):
                                      self.get_selected_position())        
     
     def select_item(self, position):
-        focus_position_before_change = self.get_selected_position()
+        # The same as 'get_selected_position()', but without the method call. (The date picker selects items on every date change.)
+        focus_position_before_change = self._listbox.focus_position if self._body_len else None
         
         nearest_valid_position = self._get_nearest_valid_position(position)
         
@@ -416,14 +575,13 @@ class IndicativeListBox(urwid.WidgetWrap):
         self.select_item(0)
         
     def select_last_item(self):
-        self.select_item(self.rearmost_position())
+        self.select_item(self._body_len - 1)
     
     def delete_position(self, position):
         # The saved properties get reseted, just in case that the appearance of the items differs.
         self._reset_highlighting()
 
-        body = self.get_body()
-        del body[position]
+        del self._listbox.body[position]
         
     def delete_selected_position(self):
         pos = self.get_selected_position()
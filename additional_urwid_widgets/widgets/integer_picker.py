@@ -3,12 +3,18 @@
 
 
 from ..assisting_modules.modifier_key import MODIFIER_KEY        # pylint: disable=unused-import
+from ..assisting_modules.useful_functions import shared_attr_map
 from .selectable_row import SelectableRow
 
 import sys      # pylint: disable=unused-import
 import urwid
 
 
+# Passed to '_change_value()' to move straight to one of the limits. The result is then clamped, so the value remains an integer.
+_NEG_INF = float("-inf")
+_POS_INF = float("inf")
+
+
 class IntegerPicker(urwid.WidgetWrap):
     """Serves as a selector for integer numbers."""
 
@@ -39,6 +45,18 @@ class IntegerPicker(urwid.WidgetWrap):
         # 'MODIFIER_KEY' changes the behavior, so that the widget responds only to modified input. ('up' => 'ctrl up')
         self._modifier_key = modifier_key
         
+        # Maps each modified navigation keystroke to the summand it passes to '_change_value()'. That way, the keystrokes are built
+        # only once and 'keypress()' needs just a single lookup.
+        self._navigation_summands = {modifier_key.prepend_to("up") : -step_len,
+                                     modifier_key.prepend_to("down") : step_len,
+                                     modifier_key.prepend_to("page up") : -jump_len,
+                                     modifier_key.prepend_to("page down") : jump_len,
+                                     modifier_key.prepend_to("home") : _NEG_INF,
+                                     modifier_key.prepend_to("end") : _POS_INF}
+        
+        # The same applies to the modified mouse event. (See 'mouse_event()'.)
+        self._modified_mouse_press = modifier_key.prepend_to("mouse press")
+        
         # Specifies whether moving upwards represents a decrease or an increase of the value.
         self._ascending = ascending
         
@@ -54,22 +72,18 @@ class IntegerPicker(urwid.WidgetWrap):
                                          None)
         
         # During the initialization of 'urwid.AttrMap', the value can be passed as non-dict. After initializing, its value can be
-        # manipulated by passing a dict. The dicts I create below will be used later to change the appearance of the widgets.
-        self._topBar_endCovered_markup = topBar_endCovered_prop[0]
-        self._topBar_endCovered_focus = {None:topBar_endCovered_prop[1]}
-        self._topBar_endCovered_offFocus = {None:topBar_endCovered_prop[2]}
-        
-        self._topBar_endExposed_markup = topBar_endExposed_prop[0]
-        self._topBar_endExposed_focus = {None:topBar_endExposed_prop[1]}
-        self._topBar_endExposed_offFocus = {None:topBar_endExposed_prop[2]}
-        
-        self._bottomBar_endCovered_markup = bottomBar_endCovered_prop[0]
-        self._bottomBar_endCovered_focus = {None:bottomBar_endCovered_prop[1]}
-        self._bottomBar_endCovered_offFocus = {None:bottomBar_endCovered_prop[2]}
-        
-        self._bottomBar_endExposed_markup = bottomBar_endExposed_prop[0]
-        self._bottomBar_endExposed_focus = {None:bottomBar_endExposed_prop[1]}
-        self._bottomBar_endExposed_offFocus = {None:bottomBar_endExposed_prop[2]}
+        # manipulated by passing a dict. The dicts I fetch below (see 'shared_attr_map()') will be used later to change the
+        # appearance of the widgets. Each bar has four appearances '(markup, attr_map)', which are indexed by
+        # '2 * end_is_exposed + focus'. (See 'render()'.)
+        self._topBar_appearances = ((topBar_endCovered_prop[0], shared_attr_map(topBar_endCovered_prop[2])),
+                                    (topBar_endCovered_prop[0], shared_attr_map(topBar_endCovered_prop[1])),
+                                    (topBar_endExposed_prop[0], shared_attr_map(topBar_endExposed_prop[2])),
+                                    (topBar_endExposed_prop[0], shared_attr_map(topBar_endExposed_prop[1])))
+        
+        self._bottomBar_appearances = ((bottomBar_endCovered_prop[0], shared_attr_map(bottomBar_endCovered_prop[2])),
+                                       (bottomBar_endCovered_prop[0], shared_attr_map(bottomBar_endCovered_prop[1])),
+                                       (bottomBar_endExposed_prop[0], shared_attr_map(bottomBar_endExposed_prop[2])),
+                                       (bottomBar_endExposed_prop[0], shared_attr_map(bottomBar_endExposed_prop[1])))
         
         # Format the number before displaying it. That way it is easier to read.
         self._display_syntax = display_syntax
@@ -82,6 +96,9 @@ class IntegerPicker(urwid.WidgetWrap):
                                      display_prop[1],
                                      display_prop[0])
         
+        # The appearances the bars were last rendered with. (See 'render()'.)
+        self._last_render_state = (None, None)
+        
         # wrap 'urwid.Pile'
         super().__init__(urwid.Pile([self._top_bar,
                                      display_attr,
@@ -92,73 +109,54 @@ class IntegerPicker(urwid.WidgetWrap):
             on_selection_change(None, value)
             
     def __repr__(self):
-        return "{}(value='{}', min_v='{}', max_v='{}', ascending='{}')".format(self.__class__.__name__,
-                                                                               self._value,
-                                                                               self._minimum,
-                                                                               self._maximum,
-                                                                               self._ascending)
+        return (f"{self.__class__.__name__}(value='{self._value}', min_v='{self._minimum}', max_v='{self._maximum}', "
+                f"ascending='{self._ascending}')")
             
     def render(self, size, focus=False):
-        # Changes the appearance of the bar at the top depending on whether the upper limit is reached.
-        if self._value == (self._minimum if self._ascending else self._maximum):
-            self._top_bar.original_widget.set_text(self._topBar_endExposed_markup)
-            self._top_bar.set_attr_map(self._topBar_endExposed_focus
-                                       if focus else self._topBar_endExposed_offFocus)
-        else:
-            self._top_bar.original_widget.set_text(self._topBar_endCovered_markup)
-            self._top_bar.set_attr_map(self._topBar_endCovered_focus
-                                       if focus else self._topBar_endCovered_offFocus)
-        
-        # Changes the appearance of the bar at the bottom depending on whether the lower limit is reached.
-        if self._value == (self._maximum if self._ascending else self._minimum):
-            self._bottom_bar.original_widget.set_text(self._bottomBar_endExposed_markup)
-            self._bottom_bar.set_attr_map(self._bottomBar_endExposed_focus
-                                          if focus else self._bottomBar_endExposed_offFocus)
-        else:
-            self._bottom_bar.original_widget.set_text(self._bottomBar_endCovered_markup)
-            self._bottom_bar.set_attr_map(self._bottomBar_endCovered_focus
-                                          if focus else self._bottomBar_endCovered_offFocus)
+        # The appearance of each bar only depends on the focus and on whether the corresponding limit is reached. (The upper limit
+        # is the minimum, if the values are in ascending order.) A bar is only updated if its appearance has changed since the
+        # last rendering.
+        topBar_index = 2 * (self._value == (self._minimum if self._ascending else self._maximum)) + bool(focus)
+        bottomBar_index = 2 * (self._value == (self._maximum if self._ascending else self._minimum)) + bool(focus)
+        
+        last_topBar_index, last_bottomBar_index = self._last_render_state
+        
+        if topBar_index != last_topBar_index:
+            markup, attr_map = self._topBar_appearances[topBar_index]
+            self._top_bar.original_widget.set_text(markup)
+            self._top_bar.set_attr_map(attr_map)
+        
+        if bottomBar_index != last_bottomBar_index:
+            markup, attr_map = self._bottomBar_appearances[bottomBar_index]
+            self._bottom_bar.original_widget.set_text(markup)
+            self._bottom_bar.set_attr_map(attr_map)
+        
+        self._last_render_state = (topBar_index, bottomBar_index)
             
         return super().render(size, focus=focus)
     
     def keypress(self, size, key):
         # A keystroke is changed to a modified one ('up' => 'ctrl up'). This prevents the widget from responding when the arrows 
         # keys are used to navigate between widgets. That way it can be used in a 'urwid.Pile' or similar.
-        if key == self._modifier_key.prepend_to("up"):
-            successful = self._change_value(-self._step_len)
-        
-        elif key == self._modifier_key.prepend_to("down"):
-            successful = self._change_value(self._step_len)
-        
-        elif key == self._modifier_key.prepend_to("page up"):
-            successful = self._change_value(-self._jump_len)
-        
-        elif key == self._modifier_key.prepend_to("page down"):
-            successful = self._change_value(self._jump_len)
-        
-        elif key == self._modifier_key.prepend_to("home"):
-            successful = self._change_value(float("-inf"))
-        
-        elif key == self._modifier_key.prepend_to("end"):
-            successful = self._change_value(float("inf"))
+        summand = self._navigation_summands.get(key)
         
-        else:
-            successful = False
+        if summand is None:
+            return key
         
-        return key if not successful else None
+        return key if not self._change_value(summand) else None
     
     def mouse_event(self, size, event, button, col, row, focus):
         if focus:
             # An event is changed to a modified one ('mouse press' => 'ctrl mouse press'). This prevents the original widget from
             # responding when mouse buttons are also used to navigate between widgets.
-            if event == self._modifier_key.prepend_to("mouse press"):
+            if event == self._modified_mouse_press:
                 # mousewheel up
-                if button == 4.0:
+                if button == 4:
                     result = self._change_value(-self._jump_len)
                     return result if self._return_unused_navigation_input else True
                 
                 # mousewheel down
-                elif button == 5.0:
+                elif button == 5:
                     result = self._change_value(self._jump_len)
                     return result if self._return_unused_navigation_input else True
         
@@ -166,64 +164,37 @@ class IntegerPicker(urwid.WidgetWrap):
     
     # This method tries to change the value depending on the desired arrangement and returns True if this change was successful.
     def _change_value(self, summand):
+        # A summand of zero ('step_len=0' or 'jump_len=0') does not move towards a limit, so the input is used without changing
+        # the value.
+        if summand == 0:
+            return True
+        
         value_before_input = self._value
         
-        if self._ascending:
-            new_value = self._value + summand
-            
-            if summand < 0:
-                # If the corresponding limit has already been reached, then determine whether the unused input should be
-                # returned or swallowed.
-                if self._value == self._minimum:
-                    return not self._return_unused_navigation_input
-                
-                # If the new value stays within the permitted range, use it.
-                elif new_value > self._minimum:
-                    self._value = new_value
-                
-                # The permitted range would be exceeded, so the limit is set instead.
-                else:
-                    self._value = self._minimum
-            
-            elif summand > 0:
-                if self._value == self._maximum:
-                    return not self._return_unused_navigation_input
-                
-                elif new_value < self._maximum:
-                    self._value = new_value
-                
-                else:
-                    self._value = self._maximum
-        else:
-            new_value = self._value - summand
-            
-            if summand < 0:
-                if self._value == self._maximum:
-                    return not self._return_unused_navigation_input
-                
-                elif new_value < self._maximum:
-                    self._value = new_value
-                
-                else:
-                    self._value = self._maximum
-            
-            elif summand > 0:
-                if self._value == self._minimum:
-                    return not self._return_unused_navigation_input
-                
-                elif new_value > self._minimum:
-                    self._value = new_value
-                
-                else:
-                    self._value = self._minimum
+        # In descending order, moving upwards increases the value.
+        new_value = value_before_input + (summand if self._ascending else -summand)
+        
+        # The permitted range would be exceeded, so the limit is set instead.
+        if new_value < self._minimum:
+            new_value = self._minimum
+        
+        elif new_value > self._maximum:
+            new_value = self._maximum
+        
+        # If the corresponding limit has already been reached, then determine whether the unused input should be returned or
+        # swallowed.
+        if new_value == value_before_input:
+            return not self._return_unused_navigation_input
+        
+        self._value = new_value
         
         # Update the displayed value.
-        self._display.set_contents([self._display_syntax.format(self._value)])
+        self._display.set_contents([self._display_syntax.format(new_value)])
         
-        # If the value has changed, execute the hook (if existing).
-        if (value_before_input != self._value) and (self.on_selection_change is not None):
+        # The value has changed, so execute the hook (if existing).
+        if self.on_selection_change is not None:
             self.on_selection_change(value_before_input,
-                                     self._value)
+                                     new_value)
         
         return True
     
@@ -5,6 +5,11 @@
 import urwid
 
 
+# The blank line between the message and the buttons has no state, so all dialogs share it. (The default background is shared
+# the same way.)
+_SPACER = urwid.Divider(" ")
+
+
 class MessageDialog(urwid.WidgetWrap):
     """Wraps 'urwid.Overlay' to show a message and expects a reaction from the user."""
     
@@ -16,7 +21,7 @@ class MessageDialog(urwid.WidgetWrap):
                  for content in contents]
         
         # Lower part
-        lower_part = [urwid.Divider(" "),
+        lower_part = [_SPACER,
                       urwid.Columns(btns, dividechars=space_between_btns)]
         
         # frame 
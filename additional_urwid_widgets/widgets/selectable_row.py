@@ -14,9 +14,19 @@ class SelectableRow(urwid.WidgetWrap):
         # A list-like object, where each element represents the value of a column.
         self.contents = contents
         
-        self._columns = urwid.Columns([urwid.Text(c, align=align) for c in contents],
+        # The values which are currently displayed. (See 'set_contents()'.)
+        self._texts = list(contents)
+        
+        # The widgets which display the values. They are kept separately from the column options, since only they are needed
+        # when the contents change.
+        self._text_widgets = [urwid.Text(c, align=align) for c in contents]
+        
+        self._columns = urwid.Columns(self._text_widgets,
                                        dividechars=space_between)
         
+        # Rows with a single column (e.g. the display of 'IntegerPicker') are updated without the loop. (See 'set_contents()'.)
+        self._single_text = self._text_widgets[0] if (len(self._texts) == 1) else None
+        
         # Wrap 'urwid.Columns'.
         super().__init__(self._columns)
         
@@ -24,8 +34,7 @@ class SelectableRow(urwid.WidgetWrap):
         self.on_select = on_select
     
     def __repr__(self):
-        return "{}(contents='{}')".format(self.__class__.__name__,
-                                          self.contents)
+        return f"{self.__class__.__name__}(contents='{self.contents}')"
     
     def selectable(self):
         return True
@@ -41,7 +50,26 @@ class SelectableRow(urwid.WidgetWrap):
         # Update the list record inplace...
         self.contents[:] = contents
         
-        # ... and update the displayed items.
-        for t, (w, _) in zip(contents, self._columns.contents):
-            w.set_text(t)
+        # ... and update the displayed items. Columns whose value has not changed are left untouched, so that their canvases
+        # remain cached.
+        texts = self._texts
+        single_text = self._single_text
+        
+        if (single_text is not None) and contents:
+            t = contents[0]
+            
+            if t != texts[0]:
+                single_text.set_text(t)
+                texts[0] = t
+            
+            return
+        
+        text_widgets = self._text_widgets
+        
+        for i in range(min(len(contents), len(text_widgets))):
+            t = contents[i]
+            
+            if t != texts[i]:
+                text_widgets[i].set_text(t)
+                texts[i] = t
             
@@ -5,10 +5,40 @@
 from additional_urwid_widgets.widgets.date_picker import DatePicker
 from additional_urwid_widgets.widgets.selectable_row import SelectableRow
 
+import collections
 import datetime
+import sys
 import urwid
 
 
+# Holding down a key delivers input much faster than a terminal can usefully display it. This main loop draws at most one frame
+# per frame budget: entering the idle state only schedules an alarm, and the regular redraw of 'urwid.MainLoop' is done once the
+# loop becomes idle after that alarm. That way, all input, alarms and watched pipes handled in the meantime share a single frame.
+# (The stand-alone example contains a copy of this class, since it does not import anything from this package.)
+class ThrottledMainLoop(urwid.MainLoop):
+    FRAME_BUDGET = 1 / 60           # seconds
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        
+        self._redraw_alarm = None
+        self._frame_due = False
+    
+    def entering_idle(self):
+        # Every event is followed by the idle state. Except after the frame alarm, it only makes sure that a frame is scheduled.
+        if self._frame_due:
+            self._frame_due = False
+            super().entering_idle()
+        
+        elif self._redraw_alarm is None:
+            self._redraw_alarm = self.set_alarm_in(self.FRAME_BUDGET, self._end_frame_budget)
+    
+    def _end_frame_budget(self, loop, user_data):
+        # The frame is drawn when the loop becomes idle afterwards, so that it includes the events handled along with this alarm.
+        self._redraw_alarm = None
+        self._frame_due = True
+
+
 # Color schemes that specify the appearance off focus and on focus.
 PALETTE = [("reveal_focus",             "black",            "white"),
            ("dp_barActive_focus",       "light gray",       ""),
@@ -21,6 +51,19 @@ PALETTE = [("reveal_focus",             "black",            "white"),
            ("text_bold",                "bold",             ""),
            ("text_esc",                 "light red,bold",   "")]
 
+# Arguments that do not change are created only once.
+_NUMERIC_MONTHS = tuple(f"{i:02d}" for i in range(13))
+
+_COLS_DMY = (DatePicker.PICKER.DAY, DatePicker.PICKER.MONTH, DatePicker.PICKER.YEAR)
+_COLS_MDY = (DatePicker.PICKER.MONTH, DatePicker.PICKER.DAY, DatePicker.PICKER.YEAR)
+_COLS_YMD_SIZED = ((6, DatePicker.PICKER.YEAR), (4, DatePicker.PICKER.MONTH), (4, DatePicker.PICKER.DAY))
+
+_TOPBAR_COVERED = ("ᐃ", "dp_barActive_focus", "dp_barActive_off_focus")
+_TOPBAR_EXPOSED = ("───", "dp_barInactive_focus", "dp_barInactive_off_focus")
+_BOTTOMBAR_COVERED = ("ᐁ", "dp_barActive_focus", "dp_barActive_off_focus")
+_BOTTOMBAR_EXPOSED = ("───", "dp_barInactive_focus", "dp_barInactive_off_focus")
+_HIGHLIGHT = ("dp_highlight_focus", "dp_highlight_off_focus")
+
 date = datetime.date(2018, 11, 15)
 
 # Navigation instructions
@@ -45,22 +88,24 @@ text_home_end = urwid.Text([("text_highlight", "ctrl"),
                             ("text_highlight", "end"),
                             ") to jump to the corresponding end."])
 
-pickers = {"left":[], "right":[]}
+# The pickers of the left and the right column.
+Pickers = collections.namedtuple("Pickers", ["left", "right"])
+pickers = Pickers(left=[], right=[])
 
 # Left column
 left_heading = "default:"
 
-pickers["left"].append(DatePicker(date,
-                                  highlight_prop=("reveal_focus", None)))
+pickers.left.append(DatePicker(date,
+                               highlight_prop=("reveal_focus", None)))
 
-pickers["left"].append(DatePicker(date,
-                                  date_range=DatePicker.RANGE.ONLY_PAST,
-                                  day_format=[DatePicker.DAY_FORMAT.DAY_OF_MONTH, DatePicker.DAY_FORMAT.WEEKDAY],
-                                  highlight_prop=("reveal_focus", None)))
+pickers.left.append(DatePicker(date,
+                               date_range=DatePicker.RANGE.ONLY_PAST,
+                               day_format=[DatePicker.DAY_FORMAT.DAY_OF_MONTH, DatePicker.DAY_FORMAT.WEEKDAY],
+                               highlight_prop=("reveal_focus", None)))
 
-pickers["left"].append(DatePicker(date,
-                                  date_range=DatePicker.RANGE.ONLY_FUTURE,
-                                  highlight_prop=("reveal_focus", None)))
+pickers.left.append(DatePicker(date,
+                               date_range=DatePicker.RANGE.ONLY_FUTURE,
+                               highlight_prop=("reveal_focus", None)))
 
 left_column = urwid.Pile([urwid.AttrMap(urwid.Text(left_heading, align="center"),
                                         "text_bold"),
@@ -68,51 +113,55 @@ left_column = urwid.Pile([urwid.AttrMap(urwid.Text(left_heading, align="center")
                           urwid.Text("▔" * len(left_heading), align="center"),
                           
                           urwid.Text("all dates:"),
-                          pickers["left"][0],
+                          pickers.left[0],
                           
                           urwid.Divider(" "),
                           
                           urwid.Text("only past:"),
-                          pickers["left"][1],
+                          pickers.left[1],
                           
                           urwid.Divider(" "),
                           
                           urwid.Text("only future:"),
-                          pickers["left"][2]])
+                          pickers.left[2]])
 
 # Right column
 right_heading = "additional parameters:"
 
-pickers["right"].append(DatePicker(date,
-                                   day_format=[DatePicker.DAY_FORMAT.DAY_OF_MONTH_TWO_DIGIT],
-                                   topBar_endCovered_prop=("ᐃ",  "dp_barActive_focus", "dp_barActive_off_focus"),
-                                   topBar_endExposed_prop=("───", "dp_barInactive_focus", "dp_barInactive_off_focus"),
-                                   bottomBar_endCovered_prop=("ᐁ",  "dp_barActive_focus", "dp_barActive_off_focus"),
-                                   bottomBar_endExposed_prop=("───", "dp_barInactive_focus", "dp_barInactive_off_focus"),
-                                   highlight_prop=("dp_highlight_focus", "dp_highlight_off_focus")))
-
-pickers["right"].append(DatePicker(date,
-                                   date_range=DatePicker.RANGE.ONLY_PAST,
-                                   day_format=[DatePicker.DAY_FORMAT.DAY_OF_MONTH],
-                                   columns=(DatePicker.PICKER.MONTH, DatePicker.PICKER.DAY, DatePicker.PICKER.YEAR),
-                                   topBar_endCovered_prop=("ᐃ",  "dp_barActive_focus", "dp_barActive_off_focus"),
-                                   topBar_endExposed_prop=("───", "dp_barInactive_focus", "dp_barInactive_off_focus"),
-                                   bottomBar_endCovered_prop=("ᐁ",  "dp_barActive_focus", "dp_barActive_off_focus"),
-                                   bottomBar_endExposed_prop=("───", "dp_barInactive_focus", "dp_barInactive_off_focus"),
-                                   highlight_prop=("dp_highlight_focus", "dp_highlight_off_focus")))
-
-pickers["right"].append(DatePicker(date,
-                                   date_range=DatePicker.RANGE.ONLY_FUTURE,
-                                   month_names=[str(i).zfill(2) for i in range(13)],
-                                   day_format=[DatePicker.DAY_FORMAT.DAY_OF_MONTH],
-                                   columns=((6, DatePicker.PICKER.YEAR), (4, DatePicker.PICKER.MONTH), (4, DatePicker.PICKER.DAY)),
-                                   space_between=1,
-                                   min_width_each_picker=4,
-                                   topBar_endCovered_prop=("ᐃ",  "dp_barActive_focus", "dp_barActive_off_focus"),
-                                   topBar_endExposed_prop=("───", "dp_barInactive_focus", "dp_barInactive_off_focus"),
-                                   bottomBar_endCovered_prop=("ᐁ",  "dp_barActive_focus", "dp_barActive_off_focus"),
-                                   bottomBar_endExposed_prop=("───", "dp_barInactive_focus", "dp_barInactive_off_focus"),
-                                   highlight_prop=("dp_highlight_focus", "dp_highlight_off_focus")))
+pickers.right.append(DatePicker(date,
+                                day_format=[DatePicker.DAY_FORMAT.DAY_OF_MONTH_TWO_DIGIT],
+                                columns=_COLS_DMY,
+                                topBar_endCovered_prop=_TOPBAR_COVERED,
+                                topBar_endExposed_prop=_TOPBAR_EXPOSED,
+                                bottomBar_endCovered_prop=_BOTTOMBAR_COVERED,
+                                bottomBar_endExposed_prop=_BOTTOMBAR_EXPOSED,
+                                highlight_prop=_HIGHLIGHT))
+
+pickers.right.append(DatePicker(date,
+                                date_range=DatePicker.RANGE.ONLY_PAST,
+                                day_format=[DatePicker.DAY_FORMAT.DAY_OF_MONTH],
+                                columns=_COLS_MDY,
+                                topBar_endCovered_prop=_TOPBAR_COVERED,
+                                topBar_endExposed_prop=_TOPBAR_EXPOSED,
+                                bottomBar_endCovered_prop=_BOTTOMBAR_COVERED,
+                                bottomBar_endExposed_prop=_BOTTOMBAR_EXPOSED,
+                                highlight_prop=_HIGHLIGHT))
+
+pickers.right.append(DatePicker(date,
+                                date_range=DatePicker.RANGE.ONLY_FUTURE,
+                                month_names=_NUMERIC_MONTHS,
+                                day_format=[DatePicker.DAY_FORMAT.DAY_OF_MONTH],
+                                columns=_COLS_YMD_SIZED,
+                                space_between=1,
+                                min_width_each_picker=4,
+                                topBar_endCovered_prop=_TOPBAR_COVERED,
+                                topBar_endExposed_prop=_TOPBAR_EXPOSED,
+                                bottomBar_endCovered_prop=_BOTTOMBAR_COVERED,
+                                bottomBar_endExposed_prop=_BOTTOMBAR_EXPOSED,
+                                highlight_prop=_HIGHLIGHT))
+
+# A flat list of all pickers, so that they can be iterated without the detour via the columns.
+all_pickers = [*pickers.left, *pickers.right]
 
 right_column = urwid.Pile([urwid.AttrMap(urwid.Text(right_heading, align="center"),
                                          "text_bold"),
@@ -120,17 +169,17 @@ right_column = urwid.Pile([urwid.AttrMap(urwid.Text(right_heading, align="center
                            urwid.Text("▔" * len(right_heading), align="center"),
                            
                            urwid.Text("d-m-y, all dates:"),       
-                           pickers["right"][0],
+                           pickers.right[0],
                            
                            urwid.Divider(" "),
                            
                            urwid.Text("m-d-y, only past:"),
-                           pickers["right"][1],
+                           pickers.right[1],
                            
                            urwid.Divider(" "),
                            
                            urwid.Text("y-m-d, numerical, only future:"),
-                           pickers["right"][2]])
+                           pickers.right[2]])
 
 # Both columns
 columns = urwid.Columns([left_column, right_column],
@@ -138,9 +187,8 @@ columns = urwid.Columns([left_column, right_column],
 
 # Reset button
 def reset(btn):
-    for col in pickers:
-        for picker in pickers[col]:
-            picker.set_date(date)
+    for picker in all_pickers:
+        picker.set_date(date)
 
 reset_button = urwid.AttrMap(SelectableRow(["Reset"], align="center", on_select=reset),
                              "",
@@ -174,12 +222,20 @@ def keypress(key):
     if key in ('q', 'Q', 'esc'):
         raise urwid.ExitMainLoop()
 
-loop = urwid.MainLoop(main_widget,
-                      PALETTE,
-                      unhandled_input=keypress)
+# The raw display compares each frame with the previous one and only writes the rows to the terminal that have changed.
+screen = urwid.raw_display.Screen()
+screen.set_terminal_properties(colors=256)
+
+# The asyncio based event loop sleeps until input arrives, instead of being woken up by the default select loop.
+loop = ThrottledMainLoop(main_widget,
+                         PALETTE,
+                         screen=screen,
+                         unhandled_input=keypress,
+                         event_loop=urwid.AsyncioEventLoop())
 loop.run()
 
-for col in pickers:
-    for i, picker in enumerate(pickers[col]):
-        print("{} picker {}: {}".format(col, i+1, picker.get_date()))
+# Write the selected dates all at once.
+sys.stdout.write("\n".join("{} picker {}: {}".format(col, i+1, picker.get_date())
+                           for col, column_pickers in zip(pickers._fields, pickers)
+                           for i, picker in enumerate(column_pickers)) + "\n")
             
\ No newline at end of file
@@ -5,9 +5,56 @@
 from additional_urwid_widgets.assisting_modules.modifier_key import MODIFIER_KEY
 from additional_urwid_widgets.widgets.indicative_listbox import IndicativeListBox
 
+import functools
 import urwid 
 
 
+# This list walker creates the buttons only when the list box asks for them, e.g. because they become visible. Recently used
+# buttons are kept, so that they don't have to be recreated while scrolling. That way, even very long lists start immediately.
+class LazyListWalker(urwid.ListWalker):
+    def __init__(self, entries, create_item, *, cache_size=1024):
+        self._entries = entries
+        self._create_item = functools.lru_cache(maxsize=cache_size)(lambda position: create_item(entries[position]))
+        self.focus = 0
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def __getitem__(self, position):
+        if not (0 <= position < len(self._entries)):
+            raise IndexError(position)
+        
+        return self._create_item(position)
+    
+    def next_position(self, position):
+        return position + 1
+    
+    def prev_position(self, position):
+        return position - 1
+    
+    def get_focus(self):
+        if len(self._entries) == 0:
+            return None, None
+        
+        return self[self.focus], self.focus
+    
+    def set_focus(self, position):
+        self.focus = position
+        self._modified()
+    
+    def get_next(self, position):
+        if (position + 1) >= len(self._entries):
+            return None, None
+        
+        return self[position + 1], position + 1
+    
+    def get_prev(self, position):
+        if position <= 0:
+            return None, None
+        
+        return self[position - 1], position - 1
+
+
 # Iterable which holds the labels for the individual list entries.
 ENTRIES = [str(i) for i in range(33)]
 
@@ -43,8 +90,8 @@ text_home_end = urwid.Text([("text_highlight", "home"),
 # Left column
 left_heading = "default:"
 
-left_list_body = urwid.SimpleListWalker([urwid.Button(entry)
-                                         for entry in ENTRIES])
+left_list_body = LazyListWalker(ENTRIES,
+                                lambda entry: urwid.AttrMap(urwid.Button(entry), None))
 
 left_column = urwid.Pile([urwid.AttrMap(urwid.Text(left_heading, align="center"),
                                         "text_bold"),
@@ -68,8 +115,8 @@ left_column = urwid.Pile([urwid.AttrMap(urwid.Text(left_heading, align="center")
 # Right column
 right_heading = "with additional parameters:"
 
-right_list_body = urwid.SimpleListWalker([urwid.AttrMap(urwid.Button(entry), "default", "reveal_focus")
-                                          for entry in ENTRIES])
+right_list_body = LazyListWalker(ENTRIES,
+                                 lambda entry: urwid.AttrMap(urwid.Button(entry), "default", "reveal_focus"))
 
 right_column = urwid.Pile([urwid.AttrMap(urwid.Text(right_heading, align="center"),
                                          "text_bold"),
@@ -4,10 +4,26 @@
 
 from setuptools import setup
 
+import os
+
 
 with open("README.md", "r") as fh:
     long_description = fh.read()
 
+# The widgets are pure python, but the modules listed here can be compiled ahead of time with Cython. This is done only on request,
+# e.g. 'ADDITIONAL_URWID_WIDGETS_COMPILE=1 python3 -m pip install .', so that a normal installation does not need a C compiler.
+COMPILABLE_MODULES = ["additional_urwid_widgets/widgets/date_picker.py",
+                      "additional_urwid_widgets/widgets/indicative_listbox.py",
+                      "additional_urwid_widgets/widgets/integer_picker.py"]
+
+if os.environ.get("ADDITIONAL_URWID_WIDGETS_COMPILE"):
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(COMPILABLE_MODULES,
+                            compiler_directives={"language_level": 3})
+else:
+    ext_modules = []
+
 setup(name="additional_urwid_widgets",
       version="0.4",
       description="Some (in my opinion) useful widgets that extend the python library 'urwid'.",
@@ -20,6 +36,7 @@ setup(name="additional_urwid_widgets",
       packages=["additional_urwid_widgets",
                 "additional_urwid_widgets.assisting_modules",
                 "additional_urwid_widgets.widgets"],
+      ext_modules=ext_modules,
       install_requires=["urwid"],
       classifiers=["Programming Language :: Python :: 3",
                    "License :: OSI Approved :: MIT License",
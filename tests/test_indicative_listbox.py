@@ -0,0 +1,33 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+import urwid
+
+from additional_urwid_widgets import IndicativeListBox
+
+
+class SetBodyTest(unittest.TestCase):
+    def test_generator(self):
+        ilb = IndicativeListBox([urwid.Text("old")])
+        
+        ilb.set_body(urwid.Text(str(i)) for i in range(3))
+        
+        body = ilb.get_body()
+        self.assertEqual(len(body), 3)
+        self.assertTrue(all(isinstance(item, urwid.AttrMap) for item in body))
+        self.assertEqual([item.original_widget.text for item in body], ["0", "1", "2"])
+    
+    def test_generator_of_wrapped_items(self):
+        ilb = IndicativeListBox([urwid.Text("old")])
+        items = [urwid.AttrMap(urwid.Text(str(i)), None) for i in range(3)]
+        
+        ilb.set_body(item for item in items)
+        
+        self.assertEqual(list(ilb.get_body()), items)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+from additional_urwid_widgets import IntegerPicker
+
+
+class ChangeValueTest(unittest.TestCase):
+    def setUp(self):
+        self.changes = []
+    
+    def _on_selection_change(self, previous_value, current_value):
+        self.changes.append((previous_value, current_value))
+    
+    def test_zero_step_len(self):
+        ip = IntegerPicker(5, step_len=0, on_selection_change=self._on_selection_change)
+        
+        self.assertIsNone(ip.keypress((10,), "up"))
+        self.assertIsNone(ip.keypress((10,), "down"))
+        self.assertEqual(ip.get_value(), 5)
+        self.assertEqual(self.changes, [])
+    
+    def test_zero_jump_len_at_limit(self):
+        # A summand of zero does not count as an attempt to pass the limit, so the input is still used.
+        ip = IntegerPicker(0, min_v=0, max_v=10, jump_len=0, on_selection_change=self._on_selection_change)
+        
+        self.assertIsNone(ip.keypress((10,), "page up"))
+        self.assertEqual(ip.get_value(), 0)
+        self.assertEqual(self.changes, [])
+    
+    def test_limit_reached(self):
+        ip = IntegerPicker(0, min_v=0, max_v=10, on_selection_change=self._on_selection_change)
+        
+        self.assertEqual(ip.keypress((10,), "up"), "up")
+        self.assertIsNone(ip.keypress((10,), "down"))
+        self.assertEqual(ip.get_value(), 1)
+        self.assertEqual(self.changes, [(0, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()